@@ -1,22 +1,72 @@
 import argparse
+import collections
+import functools
 import io
-import queue
 import socket
 import struct
+import sys
 import threading
 import time
 import tkinter as tk
 from dataclasses import dataclass
 from tkinter import ttk
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List
 import json
 
 from PIL import Image, ImageTk, ImageFilter, ImageEnhance
 
+try:
+    # Optional: OpenCV's SIMD JPEG decode and resize kernels are much faster than stock Pillow
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
+try:
+    # Optional: libjpeg-turbo's TurboJPEG API decodes with SIMD and fuses downscaling into the IDCT
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    TURBO_JPEG = TurboJPEG()
+except (ImportError, RuntimeError, OSError):  # module missing or libturbojpeg not found
+    TURBO_JPEG = None
+
 try:
     RESAMPLE_LANCZOS = Image.Resampling.LANCZOS
+    RESAMPLE_BILINEAR = Image.Resampling.BILINEAR
 except AttributeError:  # Pillow < 9.1 fallback
     RESAMPLE_LANCZOS = Image.LANCZOS
+    RESAMPLE_BILINEAR = Image.BILINEAR
+
+# BILINEAR is the right trade-off for live video; LANCZOS is only worth it for stills
+RESAMPLE_FILTERS = {
+    "bilinear": RESAMPLE_BILINEAR,
+    "lanczos": RESAMPLE_LANCZOS,
+}
+
+# Big-endian uint32 length prefix in front of the metadata and every frame.
+# Precompiled so the per-frame unpack does not re-parse the format string.
+LENGTH_PREFIX = struct.Struct('>I')
+
+# Frame format tags. Clients that announce "tagged_frames" in their metadata send one of
+# these as a single byte between the length prefix and the payload; others send bare JPEG.
+FRAME_FORMAT_JPEG = 0
+FRAME_FORMAT_RGB888 = 1  # payload: >HH width, height followed by packed RGB rows
+RAW_FRAME_HEADER = struct.Struct('>HH')
+
+if cv2 is not None:
+    # imdecode applies EXIF orientation by default, which Pillow and TurboJPEG do not; ignoring
+    # it keeps the decoded shape consistent with the header size the display size is computed from
+    OPENCV_READ_FLAG = cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION
+    OPENCV_REDUCED_READ_FLAGS = (
+        (8, cv2.IMREAD_REDUCED_COLOR_8 | cv2.IMREAD_IGNORE_ORIENTATION),
+        (4, cv2.IMREAD_REDUCED_COLOR_4 | cv2.IMREAD_IGNORE_ORIENTATION),
+        (2, cv2.IMREAD_REDUCED_COLOR_2 | cv2.IMREAD_IGNORE_ORIENTATION),
+    )
+
+# Linux only. The kernel drops back to delayed ACKs on its own, so it is re-armed after every frame.
+TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
+MAX_JPEG_FRAME_BYTES = 5 * 1024 * 1024
+MAX_RAW_FRAME_BYTES = RAW_FRAME_HEADER.size + 3840 * 2160 * 3  # 4K RGB888
 
 
 class ToolTip:
@@ -47,13 +97,6 @@ class ToolTip:
             self.tooltip_window = None
 
 
-@dataclass
-class FrameStats:
-    fps: float = 0.0
-    latency_ms: float = 0.0
-    last_updated: float = time.time()
-    camera_id: str = "default"
-    
 @dataclass
 class ImageSettings:
     """Settings for image processing"""
@@ -63,15 +106,88 @@ class ImageSettings:
     filter_type: str = "none"  # none, grayscale, blur, sharpen, edge_enhance
 
 
+def apply_image_processing(image: Image.Image, settings: ImageSettings) -> Image.Image:
+    """Apply image processing settings to the frame"""
+    try:
+        # Apply brightness
+        if settings.brightness != 1.0:
+            enhancer = ImageEnhance.Brightness(image)
+            image = enhancer.enhance(settings.brightness)
+        
+        # Apply contrast
+        if settings.contrast != 1.0:
+            enhancer = ImageEnhance.Contrast(image)
+            image = enhancer.enhance(settings.contrast)
+        
+        # Apply saturation
+        if settings.saturation != 1.0:
+            enhancer = ImageEnhance.Color(image)
+            image = enhancer.enhance(settings.saturation)
+        
+        # Apply filter
+        if settings.filter_type == "grayscale":
+            image = image.convert('L').convert('RGB')
+        elif settings.filter_type == "blur":
+            image = image.filter(ImageFilter.BLUR)
+        elif settings.filter_type == "sharpen":
+            image = image.filter(ImageFilter.SHARPEN)
+        elif settings.filter_type == "edge_enhance":
+            image = image.filter(ImageFilter.EDGE_ENHANCE)
+        
+        return image
+    except Exception:
+        # Return original image if processing fails
+        return image
+
+
+@functools.lru_cache(maxsize=64)
+def compute_display_size(image_size: tuple[int, int], bounds: tuple[int, int]) -> tuple[int, int]:
+    """Largest size with the frame's aspect ratio that fits the preview bounds.
+
+    Cached on (image_size, bounds): a stream produces identically sized frames, so after the
+    first frame (or a window resize) this is a dictionary lookup.
+    """
+    label_width = max(bounds[0], 320)
+    label_height = max(bounds[1], 240)
+
+    image_width, image_height = image_size
+    width_ratio = label_width / image_width
+    height_ratio = label_height / image_height
+    scale = min(width_ratio, height_ratio)
+
+    return (int(image_width * scale), int(image_height * scale))
+
+
 class VideoServer:
-    def __init__(self, host: str, port: int, frame_queue: queue.Queue, stats: FrameStats, camera_id: str = "default"):
+    def __init__(self, host: str, port: int, camera_id: str = "default",
+                 image_settings: Optional[ImageSettings] = None, resample: int = RESAMPLE_BILINEAR,
+                 on_frame_ready: Optional[Callable[[], None]] = None, rcvbuf: int = 0):
         self.host = host
         self.port = port
-        self.frame_queue = frame_queue
-        self.stats = stats
+        # Stream stats as plain floats: each has a single writer thread (fps/last_updated from
+        # the network thread, latency_ms from the UI thread) and float stores are atomic
+        self.fps = 0.0
+        self.latency_ms = 0.0
+        self.last_updated = time.time()
         self.camera_id = camera_id
+        self.image_settings = image_settings or ImageSettings()
+        self.resample = resample
+        self.on_frame_ready = on_frame_ready
+        self.rcvbuf = rcvbuf  # 0 leaves the kernel's receive-buffer autotuning in charge
+        # Preview area size set by the UI thread; None pauses decoding (e.g. camera not shown).
+        # Replaced as a whole tuple so the decode thread never sees a half-updated size.
+        self.display_bounds: Optional[tuple[int, int]] = None
+        # Single-slot "latest frame wins" hand-offs. A take is a read plus a reset, which the
+        # GIL does not make atomic, so one lock guards both slots (held only for the swap)
+        self._slot_lock = threading.Lock()
+        self._pending_frame: Optional[tuple] = None  # (format, payload, ts) from the network thread
+        self._frame_pending = threading.Event()
+        self._latest_frame: Optional[tuple] = None  # (width, height, rgb, ts) for the UI thread
+        # Decode-thread scratch arrays for the OpenCV path, reused while the display size holds
+        self._frame_buffers: Dict[str, "np.ndarray"] = {}
         self._should_run = threading.Event()
         self._server_thread: Optional[threading.Thread] = None
+        self._decode_thread: Optional[threading.Thread] = None
         self._client_socket: Optional[socket.socket] = None
         self._client_output_stream: Optional[socket.socket] = None
 
@@ -81,6 +197,9 @@ class VideoServer:
         self._should_run.set()
         self._server_thread = threading.Thread(target=self._run_server, daemon=True)
         self._server_thread.start()
+        if not (self._decode_thread and self._decode_thread.is_alive()):
+            self._decode_thread = threading.Thread(target=self._decode_worker, daemon=True)
+            self._decode_thread.start()
 
     def stop(self) -> None:
         self._should_run.clear()
@@ -115,26 +234,32 @@ class VideoServer:
     def _handle_client(self, client_socket: socket.socket, address) -> None:
         with client_socket:
             client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 512 * 1024)  # 512KB receive buffer
+            if self.rcvbuf > 0:
+                self._set_receive_buffer(client_socket)
             client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 64 * 1024)  # 64KB send buffer
+            # Blocking with a timeout: recv_into waits in the kernel, and socket.timeout is only
+            # raised after a 5s stall. It also keeps control-command sendall() calls atomic.
             client_socket.settimeout(5.0)
             self._client_output_stream = client_socket
             frame_count = 0
             window_start = time.time()
+            # Last few one-second (frames, seconds) windows, so the FPS readout is smoothed
+            fps_windows = collections.deque(maxlen=4)
+            tagged_frames = False
 
             # Try to read camera metadata if available
             try:
                 # Read metadata header (optional)
-                metadata_header = self._recvall(client_socket, 4)
+                metadata_header = self._recvall(client_socket, LENGTH_PREFIX.size)
                 if metadata_header:
-                    (metadata_length,) = struct.unpack('>I', metadata_header)
+                    (metadata_length,) = LENGTH_PREFIX.unpack(metadata_header)
                     if 0 < metadata_length < 1024:  # Reasonable metadata size
                         metadata_bytes = self._recvall(client_socket, metadata_length)
                         if metadata_bytes:
                             try:
                                 metadata = json.loads(metadata_bytes.decode('utf-8'))
                                 self.camera_id = metadata.get('camera_id', self.camera_id)
-                                self.stats.camera_id = self.camera_id
+                                tagged_frames = bool(metadata.get('tagged_frames', False))
                             except (json.JSONDecodeError, UnicodeDecodeError):
                                 pass
             except:
@@ -142,23 +267,40 @@ class VideoServer:
 
             while self._should_run.is_set():
                 try:
-                    header = self._recvall(client_socket, 4)
+                    header = self._recvall(client_socket, LENGTH_PREFIX.size)
                     if not header:
                         break
-                    (frame_length,) = struct.unpack('>I', header)
-                    if frame_length <= 0 or frame_length > 5 * 1024 * 1024:
+                    (frame_length,) = LENGTH_PREFIX.unpack(header)
+                    frame_format = FRAME_FORMAT_JPEG
+                    if tagged_frames:
+                        tag = self._recvall(client_socket, 1)
+                        if not tag:
+                            break
+                        frame_format = tag[0]
+                    max_length = MAX_RAW_FRAME_BYTES if frame_format == FRAME_FORMAT_RGB888 else MAX_JPEG_FRAME_BYTES
+                    if frame_length <= 0 or frame_length > max_length:
                         continue
                     frame_data = self._recvall(client_socket, frame_length)
                     if not frame_data:
                         break
+                    if TCP_QUICKACK is not None:
+                        # ACK the frame's tail immediately so the sender is not held up to 40ms
+                        try:
+                            client_socket.setsockopt(socket.IPPROTO_TCP, TCP_QUICKACK, 1)
+                        except OSError:
+                            pass
+                    if frame_format not in (FRAME_FORMAT_JPEG, FRAME_FORMAT_RGB888):
+                        # Unknown format: the payload has been consumed, so just drop it
+                        continue
 
                     now = time.time()
-                    self._push_frame(frame_data, now)
+                    self._push_frame(frame_format, frame_data, now)
 
                     frame_count += 1
                     elapsed = now - window_start
                     if elapsed >= 1.0:
-                        self.stats.fps = frame_count / elapsed
+                        fps_windows.append((frame_count, elapsed))
+                        self.fps = sum(count for count, _ in fps_windows) / sum(span for _, span in fps_windows)
                         frame_count = 0
                         window_start = now
                 except (socket.timeout, ConnectionError, struct.error):
@@ -168,42 +310,184 @@ class VideoServer:
             
             self._client_output_stream = None
 
-    def _push_frame(self, frame_data: bytes, timestamp: float) -> None:
-        # Drop old frames immediately for minimal latency - only keep latest frame
-        # Clear queue completely to ensure we always show the latest frame
-        while not self.frame_queue.empty():
+    def _set_receive_buffer(self, client_socket: socket.socket) -> None:
+        # A fixed SO_RCVBUF disables Linux autotuning, so it is only set on request
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+        # Linux reports double the requested size (bookkeeping overhead) and caps it at net.core.rmem_max
+        actual = client_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if sys.platform.startswith('linux'):
+            actual //= 2
+        if actual < self.rcvbuf:
+            print(f"Receive buffer capped at {actual} bytes (requested {self.rcvbuf}); "
+                  f"raise net.core.rmem_max to allow more")
+
+    def _push_frame(self, frame_format: int, frame_data: bytearray, timestamp: float) -> None:
+        # Overwrite any frame the decode thread has not picked up yet - only keep latest frame
+        with self._slot_lock:
+            self._pending_frame = (frame_format, frame_data, timestamp)
+        self._frame_pending.set()
+        self.last_updated = timestamp
+
+    def take_frame(self) -> Optional[tuple[int, int, bytes, float]]:
+        """Return the newest decoded frame, or None if nothing new arrived since the last call"""
+        with self._slot_lock:
+            frame, self._latest_frame = self._latest_frame, None
+        return frame
+
+    def _decode_worker(self) -> None:
+        """Decode and scale JPEG frames off the Tk thread, publishing raw RGB for display"""
+        while self._should_run.is_set():
+            if not self._frame_pending.wait(timeout=0.5):
+                continue
+            # Clear before taking the frame so a concurrent push re-arms the event
+            self._frame_pending.clear()
+            with self._slot_lock:
+                pending, self._pending_frame = self._pending_frame, None
+            bounds = self.display_bounds
+            if pending is None or bounds is None:
+                continue
+            frame_format, frame_data, timestamp = pending
             try:
-                self.frame_queue.get_nowait()
-            except queue.Empty:
+                decoded = self._decode_frame(frame_format, frame_data, bounds)
+            except Exception:
+                # Skip corrupt frames rather than killing the decode thread
+                continue
+            with self._slot_lock:
+                self._latest_frame = (*decoded, timestamp)
+            if self.on_frame_ready:
+                self.on_frame_ready()
+
+    def _decode_frame(self, frame_format: int, frame_data: bytearray,
+                      bounds: tuple[int, int]) -> tuple[int, int, bytes]:
+        if frame_format == FRAME_FORMAT_RGB888:
+            image = self._decode_rgb888(frame_data, bounds)
+        elif TURBO_JPEG is not None:
+            image = self._decode_jpeg_turbo(frame_data, bounds)
+        elif cv2 is not None:
+            image = self._decode_jpeg_opencv(frame_data, bounds)
+        else:
+            image = self._decode_jpeg_pillow(frame_data, bounds)
+
+        # Apply image processing filters on the already-scaled frame
+        image = apply_image_processing(image, self.image_settings)
+
+        width, height = image.size
+        # Always hand packed RGB to the UI; this also drops the pad byte of RGBX frames
+        return width, height, image.tobytes("raw", "RGB")
+
+    def _draft_target(self, display_size: tuple[int, int]) -> tuple[int, int]:
+        """Smallest size a JPEG backend may IDCT-scale down to before the final resize.
+
+        LANCZOS keeps 2x headroom so its kernel still has detail to work with.
+        """
+        oversample = 2 if self.resample == RESAMPLE_LANCZOS else 1
+        return display_size[0] * oversample, display_size[1] * oversample
+
+    def _decode_rgb888(self, frame_data: bytearray, bounds: tuple[int, int]) -> Image.Image:
+        # Raw pixels skip JPEG decoding entirely. Pillow does not map "RGB" buffers in place,
+        # so frombuffer makes one unpacking copy into its 4-byte-per-pixel layout.
+        size = RAW_FRAME_HEADER.unpack_from(frame_data)
+        pixels = memoryview(frame_data)[RAW_FRAME_HEADER.size:]
+        image = Image.frombuffer("RGB", size, pixels, "raw", "RGB", 0, 1)
+        display_size = compute_display_size(image.size, bounds)
+        if display_size != image.size:
+            image = image.resize(display_size, self.resample)
+        return image
+
+    def _decode_jpeg_pillow(self, frame_data: bytearray, bounds: tuple[int, int]) -> Image.Image:
+        # Image.open is lazy: the header gives us the size before any pixels are decoded
+        image = Image.open(io.BytesIO(frame_data))
+        display_size = compute_display_size(image.size, bounds)
+        # Let libjpeg IDCT-scale by 1/2, 1/4 or 1/8 during decode, never below the draft target
+        image.draft("RGB", self._draft_target(display_size))
+        image = image.convert("RGB")
+        if display_size != image.size:
+            image = image.resize(display_size, self.resample)
+        return image
+
+    def _decode_jpeg_turbo(self, frame_data: bytearray, bounds: tuple[int, int]) -> Image.Image:
+        image_width, image_height, _, _ = TURBO_JPEG.decode_header(frame_data)
+        display_size = compute_display_size((image_width, image_height), bounds)
+        target_width, target_height = self._draft_target(display_size)
+
+        # Smallest IDCT scaling factor whose output still covers the target
+        scaling_factor = None
+        for num, denom in sorted(TURBO_JPEG.scaling_factors, key=lambda f: f[0] / f[1]):
+            if num > denom:
+                break
+            if (-(-image_width * num // denom) >= target_width and
+                    -(-image_height * num // denom) >= target_height):
+                scaling_factor = (num, denom)
+                break
+
+        pixels = TURBO_JPEG.decode(frame_data, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+        image = Image.frombuffer("RGB", (pixels.shape[1], pixels.shape[0]), pixels, "raw", "RGB", 0, 1)
+        if display_size != image.size:
+            image = image.resize(display_size, self.resample)
+        return image
+
+    def _decode_jpeg_opencv(self, frame_data: bytearray, bounds: tuple[int, int]) -> Image.Image:
+        # Only the JPEG header is parsed here; OpenCV does the actual decode
+        image_width, image_height = Image.open(io.BytesIO(frame_data)).size
+        display_size = compute_display_size((image_width, image_height), bounds)
+        target_width, target_height = self._draft_target(display_size)
+
+        # Same IDCT scaling as Pillow's draft(): pick the largest reduction that stays above target
+        read_flag = OPENCV_READ_FLAG
+        for factor, flag in OPENCV_REDUCED_READ_FLAGS:
+            if image_width // factor >= target_width and image_height // factor >= target_height:
+                read_flag = flag
                 break
-        # Add the new frame
-        try:
-            self.frame_queue.put_nowait((frame_data, timestamp))
-        except queue.Full:
-            # Should not happen since we just cleared the queue, but handle gracefully
-            pass
-        self.stats.last_updated = timestamp
 
-    def _recvall(self, client_socket: socket.socket, length: int) -> Optional[bytes]:
+        pixels = cv2.imdecode(np.frombuffer(frame_data, np.uint8), read_flag)
+        if pixels is None:
+            raise ValueError("OpenCV could not decode frame")
+        if (pixels.shape[1], pixels.shape[0]) != display_size:
+            interpolation = cv2.INTER_LANCZOS4 if self.resample == RESAMPLE_LANCZOS else cv2.INTER_AREA
+            resized = self._frame_buffer("resized", display_size)
+            cv2.resize(pixels, display_size, dst=resized, interpolation=interpolation)
+            pixels = resized
+        # Convert into a 4-channel scratch array: Pillow maps RGBX buffers in place (RGB ones
+        # are always copied), and _decode_frame copies out with tobytes() before the next frame
+        rgbx = self._frame_buffer("rgbx", display_size, channels=4)
+        cv2.cvtColor(pixels, cv2.COLOR_BGR2RGBA, dst=rgbx)
+        return Image.frombuffer("RGBX", display_size, rgbx, "raw", "RGBX", 0, 1)
+
+    def _frame_buffer(self, name: str, size: tuple[int, int], channels: int = 3) -> "np.ndarray":
+        shape = (size[1], size[0], channels)
+        buffer = self._frame_buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, np.uint8)
+            self._frame_buffers[name] = buffer
+        return buffer
+
+    def _recvall(self, client_socket: socket.socket, length: int) -> Optional[bytearray]:
+        # Receive straight into a preallocated buffer and hand it out without a final copy;
+        # every consumer (struct, json, BytesIO) accepts bytes-like objects
         data = bytearray(length)
         view = memoryview(data)
         received = 0
         while received < length:
             try:
-                nbytes = client_socket.recv_into(view[received:])
+                nbytes = client_socket.recv_into(view[received:], length - received)
             except socket.timeout:
                 return None
             if nbytes == 0:
                 return None
             received += nbytes
-        return bytes(data)
+        return data
     
     def send_control_command(self, command: str) -> None:
         """Send control command to the Android client"""
-        if self._client_output_stream:
+        self.send_control_batch([command])
+
+    def send_control_batch(self, commands: List[str]) -> None:
+        """Send several control commands in a single write (one packet with TCP_NODELAY)"""
+        if self._client_output_stream and commands:
             try:
-                # Send command as UTF-8 string with length prefix
-                self._client_output_stream.sendall(command.encode('utf-8') + b'\n')
+                # Client reads newline-terminated UTF-8 commands
+                payload = ''.join(f"{command}\n" for command in commands)
+                self._client_output_stream.sendall(payload.encode('utf-8'))
             except Exception as e:
                 print(f"Failed to send control command: {e}")
 
@@ -212,19 +496,13 @@ class VideoServer:
 class ViewerApp(tk.Tk):
     def __init__(self, args: argparse.Namespace):
         super().__init__()
+        # Keep the window unmapped while styles and widgets are created, so Tk lays
+        # everything out once and the first paint is the finished UI
+        self.withdraw()
         self.title("🎥 Camera Streamer - Multi-Camera Viewer")
         self.geometry("1920x1080")  # Larger window for bigger video preview
         self.resizable(True, True)
         self.configure(bg='#f5f7fa')
-        
-        # Start with maximized window for best video preview experience
-        try:
-            self.state('zoomed')  # Windows
-        except:
-            try:
-                self.attributes('-zoomed', True)  # Linux
-            except:
-                pass  # macOS doesn't have this, geometry will handle it
 
         # Enable high DPI scaling
         try:
@@ -243,39 +521,57 @@ class ViewerApp(tk.Tk):
         self._setup_styles()
 
         # Multi-camera support
-        self.cameras: Dict[str, Dict] = {}  # camera_id -> {server, stats, queue, etc.}
+        self.cameras: Dict[str, Dict] = {}  # camera_id -> {server, host, port}
         self.active_camera_id: Optional[str] = None
         self.image_settings = ImageSettings()
+        self._resample = RESAMPLE_FILTERS[args.resample]
+        self._rcvbuf = args.rcvbuf
+        
+        # Slider drags fire on every pixel; keep only the latest value per control and flush them together
+        self._pending_controls: Dict[str, str] = {}
+        self._control_flush_after: Optional[str] = None
         
         # Setup first camera (default)
         self._add_camera("Camera 1", args.host, args.port)
         self.active_camera_id = "Camera 1"
 
         self._photo_image: Optional[ImageTk.PhotoImage] = None
+        self._photo_size: tuple[int, int] = (0, 0)
+        self._label_size: tuple[int, int] = (0, 0)  # kept current by <Configure>
+        self._status_texts: Dict[str, str] = {}  # last text written to each status bar variable
         self._current_image_ts: float = 0.0
-        self._cached_display_size: Optional[tuple[int, int]] = None
-        self._last_label_size: tuple[int, int] = (0, 0)
 
         self._build_ui(args)
+
+        # Show the window only now; zooming must come after deiconify, which resets the state
+        self.deiconify()
+        # Start with maximized window for best video preview experience
+        try:
+            self.state('zoomed')  # Windows
+        except:
+            try:
+                self.attributes('-zoomed', True)  # Linux
+            except:
+                pass  # macOS doesn't have this, geometry will handle it
         
         # Start all camera servers
         for camera in self.cameras.values():
             camera['server'].start()
             
         self.protocol("WM_DELETE_WINDOW", self._on_close)
-        self.after(8, self._poll_frames)  # ~8ms for 120Hz polling (2x 60fps for smooth handling)
+        # Decode threads wake the UI when a frame is ready; the slow timer only catches lost events
+        self.bind("<<FrameReady>>", self._poll_frames)
+        self.after(250, self._frame_watchdog)
         self.after(500, self._refresh_stats)
     
     def _add_camera(self, camera_id: str, host: str, port: int) -> None:
         """Add a new camera stream"""
-        frame_queue = queue.Queue(maxsize=1)
-        stats = FrameStats(camera_id=camera_id)
-        server = VideoServer(host, port, frame_queue, stats, camera_id)
+        server = VideoServer(host, port, camera_id,
+                             image_settings=self.image_settings, resample=self._resample,
+                             on_frame_ready=self._notify_frame_ready, rcvbuf=self._rcvbuf)
         
         self.cameras[camera_id] = {
             'server': server,
-            'stats': stats,
-            'queue': frame_queue,
             'host': host,
             'port': port
         }
@@ -283,6 +579,9 @@ class ViewerApp(tk.Tk):
     def _switch_camera(self, camera_id: str) -> None:
         """Switch active camera view"""
         if camera_id in self.cameras:
+            # Only the visible camera needs its frames decoded
+            if self.active_camera_id in self.cameras:
+                self.cameras[self.active_camera_id]['server'].display_bounds = None
             self.active_camera_id = camera_id
             self._update_camera_label()
 
@@ -408,8 +707,28 @@ class ViewerApp(tk.Tk):
         ip_frame = ttk.Frame(info_row, style='Header.TFrame')
         ip_frame.pack(side=tk.LEFT)
         ttk.Label(ip_frame, text="� Local IPs:", style='Info.TLabel').pack(side=tk.LEFT, padx=(0, 5))
-        ips_text = ', '.join(get_local_ip_addresses())
-        ttk.Label(ip_frame, text=ips_text, style='Value.TLabel').pack(side=tk.LEFT)
+        ips_label = ttk.Label(ip_frame, text="detecting...", style='Value.TLabel')
+        ips_label.pack(side=tk.LEFT)
+
+        # Hostname resolution can block for seconds on restricted networks; keep it off the UI thread.
+        # The worker only fills a slot; all Tk calls stay on the UI thread, which checks it below.
+        ips_result: list = [None]
+
+        def lookup_ips() -> None:
+            try:
+                ips_result[0] = ', '.join(get_local_ip_addresses())
+            except Exception:
+                # Always publish something so show_ips stops polling
+                ips_result[0] = "unavailable"
+
+        def show_ips() -> None:
+            if ips_result[0] is None:
+                self.after(100, show_ips)
+            else:
+                ips_label.config(text=ips_result[0])
+
+        threading.Thread(target=lookup_ips, daemon=True).start()
+        self.after(100, show_ips)
 
     def _build_camera_controls(self, parent: ttk.Frame) -> None:
         """Build the clean camera controls panel"""
@@ -549,6 +868,10 @@ class ViewerApp(tk.Tk):
                                    bg='#f8fafc', relief='solid', borderwidth=1,
                                    cursor='hand2')
         self.video_label.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        self.video_label.bind('<Configure>', self._on_video_label_configure)
+
+    def _on_video_label_configure(self, event) -> None:
+        self._label_size = (event.width, event.height)
 
     def _build_status_bar(self, parent: ttk.Frame) -> None:
         """Build the clean status bar with connection status"""
@@ -586,119 +909,87 @@ class ViewerApp(tk.Tk):
                                      command=self._stop_server, style='TButton', width=10)
         self.stop_button.pack(side=tk.RIGHT)
 
-    def _poll_frames(self) -> None:
+    def _notify_frame_ready(self) -> None:
+        """Called from a decode thread; queues a <<FrameReady>> event on the Tk event loop"""
         try:
-            # Get frame from active camera
-            if self.active_camera_id and self.active_camera_id in self.cameras:
-                camera = self.cameras[self.active_camera_id]
-                frame_data, timestamp = camera['queue'].get_nowait()
-                self._display_frame(frame_data, timestamp)
-        except queue.Empty:
+            self.event_generate("<<FrameReady>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window is being torn down
             pass
-        finally:
-            self.after(8, self._poll_frames)  # ~8ms for 120Hz polling
 
-    def _display_frame(self, frame_data: bytes, timestamp: float) -> None:
+    def _frame_watchdog(self) -> None:
+        self._poll_frames()
+        self.after(250, self._frame_watchdog)
+
+    def _poll_frames(self, event=None) -> None:
+        # Get frame from active camera
+        if self.active_camera_id and self.active_camera_id in self.cameras:
+            server = self.cameras[self.active_camera_id]['server']
+            server.display_bounds = self._label_size
+            frame = server.take_frame()
+            if frame is not None:
+                self._display_frame(*frame)
+
+    def _display_frame(self, width: int, height: int, rgb_data: bytes, timestamp: float) -> None:
         try:
-            image = Image.open(io.BytesIO(frame_data)).convert("RGB")
-            
-            # Apply image processing filters
-            image = self._apply_image_processing(image)
-            
-            # Use BILINEAR for faster resizing (good quality, much faster than LANCZOS)
-            display_size = self._compute_display_size(image.size)
-            if display_size != image.size:
-                image = image.resize(display_size, Image.Resampling.BILINEAR)
-            self._photo_image = ImageTk.PhotoImage(image)
-            self.video_label.configure(image=self._photo_image, text="")
+            # Frames arrive already decoded and scaled by the server's decode thread
+            image = Image.frombuffer("RGB", (width, height), rgb_data, "raw", "RGB", 0, 1)
+            if self._photo_image is None or self._photo_size != (width, height):
+                # Reallocate the Tk photo only when the display size changes; this also
+                # replaces the "Waiting..." placeholder text the first time round
+                self._photo_image = ImageTk.PhotoImage("RGB", (width, height))
+                self._photo_size = (width, height)
+                self.video_label.configure(image=self._photo_image, text="")
+            # Decoders always emit exactly the display size, so this is a straight block copy
+            # into the existing Tk photo with no per-frame image allocation or Tcl size queries
+            self._photo_image.paste(image)
             now = time.time()
             
             # Update stats for active camera
             if self.active_camera_id and self.active_camera_id in self.cameras:
-                stats = self.cameras[self.active_camera_id]['stats']
-                stats.latency_ms = max((now - timestamp) * 1000.0, 0.0)
+                server = self.cameras[self.active_camera_id]['server']
+                server.latency_ms = max((now - timestamp) * 1000.0, 0.0)
             
             self._current_image_ts = now
         except Exception:
             # Silently ignore frame display errors to avoid disrupting stream
             return
 
-    def _compute_display_size(self, image_size: tuple[int, int]) -> tuple[int, int]:
-        label_width = max(self.video_label.winfo_width(), 320)
-        label_height = max(self.video_label.winfo_height(), 240)
-        
-        # Cache display size if label size hasn't changed
-        current_label_size = (label_width, label_height)
-        if (self._cached_display_size is not None and 
-            self._last_label_size == current_label_size):
-            return self._cached_display_size
-        
-        image_width, image_height = image_size
-        width_ratio = label_width / image_width
-        height_ratio = label_height / image_height
-        scale = min(width_ratio, height_ratio)
-        
-        display_size = (int(image_width * scale), int(image_height * scale))
-        self._cached_display_size = display_size
-        self._last_label_size = current_label_size
-        return display_size
-    
-    def _apply_image_processing(self, image: Image.Image) -> Image.Image:
-        """Apply image processing settings to the frame"""
-        try:
-            # Apply brightness
-            if self.image_settings.brightness != 1.0:
-                enhancer = ImageEnhance.Brightness(image)
-                image = enhancer.enhance(self.image_settings.brightness)
-            
-            # Apply contrast
-            if self.image_settings.contrast != 1.0:
-                enhancer = ImageEnhance.Contrast(image)
-                image = enhancer.enhance(self.image_settings.contrast)
-            
-            # Apply saturation
-            if self.image_settings.saturation != 1.0:
-                enhancer = ImageEnhance.Color(image)
-                image = enhancer.enhance(self.image_settings.saturation)
-            
-            # Apply filter
-            if self.image_settings.filter_type == "grayscale":
-                image = image.convert('L').convert('RGB')
-            elif self.image_settings.filter_type == "blur":
-                image = image.filter(ImageFilter.BLUR)
-            elif self.image_settings.filter_type == "sharpen":
-                image = image.filter(ImageFilter.SHARPEN)
-            elif self.image_settings.filter_type == "edge_enhance":
-                image = image.filter(ImageFilter.EDGE_ENHANCE)
-            
-            return image
-        except Exception:
-            # Return original image if processing fails
-            return image
-
     def _refresh_stats(self) -> None:
         """Update the FPS and latency display"""
         if self.active_camera_id and self.active_camera_id in self.cameras:
-            stats = self.cameras[self.active_camera_id]['stats']
-            elapsed = time.time() - stats.last_updated
-            if elapsed < 2.0 and stats.fps > 0:
-                self.fps_var.set(f"FPS: {stats.fps:.1f}")
-                self.latency_var.set(f"Latency: {stats.latency_ms:.0f}ms")
-                self.status_var.set(f"🎬 Streaming: {stats.camera_id}")
+            server = self.cameras[self.active_camera_id]['server']
+            # Bind each value once so the checks and the labels use the same reading
+            fps = server.fps
+            latency_ms = server.latency_ms
+            last_updated = server.last_updated
+            elapsed = time.time() - last_updated
+            if elapsed < 2.0 and fps > 0:
+                self._set_status_text(self.fps_var, f"FPS: {fps:.1f}")
+                self._set_status_text(self.latency_var, f"Latency: {latency_ms:.0f}ms")
+                self._set_status_text(self.status_var, f"🎬 Streaming: {server.camera_id}")
             else:
-                self.fps_var.set("FPS: --")
-                self.latency_var.set("Latency: --ms")
-                self.status_var.set("⏳ Waiting for stream...")
+                self._set_status_text(self.fps_var, "FPS: --")
+                self._set_status_text(self.latency_var, "Latency: --ms")
+                self._set_status_text(self.status_var, "⏳ Waiting for stream...")
         else:
-            self.fps_var.set("FPS: --")
-            self.latency_var.set("Latency: --ms")
-            self.status_var.set("⏳ No camera selected...")
+            self._set_status_text(self.fps_var, "FPS: --")
+            self._set_status_text(self.latency_var, "Latency: --ms")
+            self._set_status_text(self.status_var, "⏳ No camera selected...")
         self.after(500, self._refresh_stats)
 
+    def _set_status_text(self, var: tk.StringVar, text: str) -> None:
+        # StringVar.set fires traces and a label redraw even for an identical value,
+        # so only touch Tk when the rounded, formatted text actually changes
+        name = str(var)
+        if self._status_texts.get(name) != text:
+            self._status_texts[name] = text
+            var.set(text)
+
     def _stop_server(self) -> None:
         for camera in self.cameras.values():
             camera['server'].stop()
-        self.status_var.set("All servers stopped")
+        self._set_status_text(self.status_var, "All servers stopped")
 
     def _on_close(self) -> None:
         self._stop_server()
@@ -707,20 +998,29 @@ class ViewerApp(tk.Tk):
     def _on_zoom_change(self, value: str) -> None:
         zoom_value = float(value)
         self.zoom_label.config(text=f"{zoom_value:.1f}x")
-        if self.active_camera_id and self.active_camera_id in self.cameras:
-            self.cameras[self.active_camera_id]['server'].send_control_command(f"ZOOM:{zoom_value:.2f}")
+        self._queue_control_command("ZOOM", f"ZOOM:{zoom_value:.2f}")
     
     def _on_exposure_change(self, value: str) -> None:
         exposure_value = int(float(value))
         self.exposure_label.config(text=str(exposure_value))
-        if self.active_camera_id and self.active_camera_id in self.cameras:
-            self.cameras[self.active_camera_id]['server'].send_control_command(f"EXPOSURE:{exposure_value}")
+        self._queue_control_command("EXPOSURE", f"EXPOSURE:{exposure_value}")
     
     def _on_focus_change(self, value: str) -> None:
         focus_value = float(value)
         self.focus_label.config(text=f"{focus_value:.2f}")
+        self._queue_control_command("FOCUS", f"FOCUS:{focus_value:.2f}")
+    
+    def _queue_control_command(self, control: str, command: str) -> None:
+        self._pending_controls[control] = command
+        if self._control_flush_after is None:
+            self._control_flush_after = self.after(50, self._flush_control_commands)
+    
+    def _flush_control_commands(self) -> None:
+        self._control_flush_after = None
+        commands = list(self._pending_controls.values())
+        self._pending_controls.clear()
         if self.active_camera_id and self.active_camera_id in self.cameras:
-            self.cameras[self.active_camera_id]['server'].send_control_command(f"FOCUS:{focus_value:.2f}")
+            self.cameras[self.active_camera_id]['server'].send_control_batch(commands)
     
     def _on_brightness_change(self, value: str) -> None:
         brightness_value = float(value)
@@ -834,13 +1134,18 @@ class ViewerApp(tk.Tk):
         self.image_settings.saturation = 1.0
         self.image_settings.filter_type = "none"
         
+        # Drop any debounced slider values so they cannot override the reset
+        if self._control_flush_after is not None:
+            self.after_cancel(self._control_flush_after)
+            self._control_flush_after = None
+        self._pending_controls.clear()
+        
         if self.active_camera_id and self.active_camera_id in self.cameras:
             server = self.cameras[self.active_camera_id]['server']
-            server.send_control_command("ZOOM:1.0")
-            server.send_control_command("EXPOSURE:0")
-            server.send_control_command("FOCUS:0.5")
+            server.send_control_batch(["ZOOM:1.0", "EXPOSURE:0", "FOCUS:0.5"])
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip_addresses() -> list[str]:
     ips: list[str] = []
     try:
@@ -853,6 +1158,7 @@ def get_local_ip_addresses() -> list[str]:
 
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.5)
             s.connect(("8.8.8.8", 80))
             ips.append(s.getsockname()[0])
     except OSError:
@@ -865,6 +1171,10 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Laptop listener for ChessAssist streaming client")
     parser.add_argument("--host", default="0.0.0.0", help="Host/IP to bind the server to")
     parser.add_argument("--port", type=int, default=5000, help="Port to listen on")
+    parser.add_argument("--resample", choices=sorted(RESAMPLE_FILTERS), default="bilinear",
+                        help="Resampling filter used to scale frames to the preview size")
+    parser.add_argument("--rcvbuf", type=int, default=0,
+                        help="Socket receive buffer in bytes, e.g. 8388608 for 8MB (0 = OS autotuning)")
     return parser.parse_args()
 
 